@@ -70,6 +70,32 @@ def is_animated(target: object, attribute: str) -> bool:
     return attribute in animated
 
 
+SAMPLES_PER_SECOND = 60
+"""The number of easing samples precomputed per second of animation duration."""
+
+
+def _sample_easing(
+    easing: Callable[[float], float], duration: int
+) -> tuple[float, ...]:
+    """Samples an easing function over the given duration.
+
+    The resulting table is stored on the animation, so stepping it only needs a
+    table lookup.
+
+    Args:
+        easing: A function mapping linear progress (0.0 - 1.0) to eased progress.
+        duration: The duration of the animation, in milliseconds.
+
+    Returns:
+        A tuple of eased progress values, at least 2 long.
+    """
+
+    count = max(2, int(duration / 1000 * SAMPLES_PER_SECOND))
+    last = count - 1
+
+    return tuple(easing(i / last) for i in range(count))
+
+
 class Direction(Enum):
     """Animation directions."""
 
@@ -96,6 +122,9 @@ class Animation:
         self._remaining = self.duration
         self._is_paused = False
 
+        # Precomputed so `_update_state` can multiply instead of divide every frame.
+        self._inv_duration = 1 / self.duration if self.duration != 0 else 0.0
+
     def _update_state(self, elapsed: float) -> bool:
         """Updates the internal float state of the animation.
 
@@ -111,7 +140,12 @@ class Animation:
 
         self._remaining -= elapsed * 1000
 
-        self.state = (self.duration - self._remaining) / self.duration
+        if self._inv_duration == 0.0:
+            # Zero-length animations jump straight to completion.
+            self.state = 1.0 if self.direction is Direction.FORWARD else 0.0
+            return not self.loop
+
+        self.state = (self.duration - self._remaining) * self._inv_duration
 
         if self.direction is Direction.BACKWARD:
             self.state = 1 - self.state
@@ -127,6 +161,15 @@ class Animation:
 
         return False
 
+    @property
+    def is_noop(self) -> bool:
+        """Returns whether stepping this animation can't change anything.
+
+        Such animations can be finished right away, instead of being scheduled.
+        """
+
+        return not self.loop and self.duration == 0
+
     def pause(self, setting: bool = True) -> None:
         """Pauses the animation."""
 
@@ -188,13 +231,18 @@ class FloatAnimation(Animation):
 
 @dataclass
 class AttrAnimation(Animation):
-    """Animates an attribute going from one value to another."""
+    """Animates an attribute going from one value to another.
+
+    If `easing` is given, it is sampled once into a lookup table when the animation
+    is created, which is then indexed by the animation's state on every step.
+    """
 
     target: object = None
     attr: str = ""
     value_type: type = int
     end: int | float = 0
     start: int | float | None = None
+    easing: Callable[[float], float] | None = None
 
     on_step: Callable[[Animation], bool] | None = None
     on_finish: Callable[[Animation], None] | None = None
@@ -211,11 +259,20 @@ class AttrAnimation(Animation):
         if self.start is None:
             self.start = getattr(self.target, self.attr)
 
-        if self.end < self.start:
+        # Decreasing animations run backwards over the flipped range, so their
+        # state goes from 1 to 0 as time passes.
+        self._flipped = self.end < self.start
+        if self._flipped:
             self.start, self.end = self.end, self.start
             self.direction = Direction.BACKWARD
 
+        # From here on, `end` stores the distance from `start`, not the endpoint.
         self.end -= self.start
+        self._last_value: Any = None
+
+        self._samples: tuple[float, ...] | None = None
+        if self.easing is not None:
+            self._samples = _sample_easing(self.easing, self.duration)
 
         _add_flag(self.target, self.attr)
 
@@ -228,8 +285,27 @@ class AttrAnimation(Animation):
 
         assert self.start is not None
 
-        updated = self.start + (self.end * self.state)
-        setattr(self.target, self.attr, self.value_type(updated))
+        progress = self.state
+        if self._samples is not None:
+            last = len(self._samples) - 1
+
+            # Easing is defined over elapsed time, which a flipped animation's state
+            # runs against. Sample at the mirrored point & mirror the result back.
+            if self._flipped:
+                index = int((1 - progress) * last + 0.5)
+                progress = 1 - self._samples[min(last, max(0, index))]
+
+            else:
+                index = int(progress * last + 0.5)
+                progress = self._samples[min(last, max(0, index))]
+
+        updated = self.value_type(self.start + (self.end * progress))
+
+        # Setting attributes on widgets may trigger expensive setters, so we only
+        # write when the (usually integer) value actually changes.
+        if updated != self._last_value:
+            setattr(self.target, self.attr, updated)
+            self._last_value = updated
 
         if self.on_step is not None:
             step_finished = self.on_step(self)
@@ -239,6 +315,16 @@ class AttrAnimation(Animation):
 
         return False
 
+    @property
+    def is_noop(self) -> bool:
+        """Returns whether stepping this animation can't change anything.
+
+        On top of the base checks, this is true when the attribute is already at its
+        endpoint.
+        """
+
+        return super().is_noop or (not self.loop and self.end == 0)
+
     def finish(self) -> None:
         """Deletes `__ptg_animated__` flag, calls `on_finish`."""
 
@@ -275,13 +361,43 @@ class Animator:
     def step(self, elapsed: float) -> None:
         """Steps the animation forward by the given elapsed time."""
 
-        for animation in self._animations.copy():
+        # Animations are dataclasses, so `list.remove` would compare by value and
+        # could drop the wrong (equal) instance. Instead, the unfinished ones are
+        # collected in a single pass and swapped in *before* any `finish` is called,
+        # so animations re-scheduled by their `on_finish` (even the same instance)
+        # land in the new list.
+        animations = self._animations
+        count = len(animations)
+
+        running: list[Animation] = []
+        finished: list[Animation] = []
+
+        for animation in animations[:count]:
             if animation.step(elapsed):
-                self._animations.remove(animation)
-                animation.finish()
+                finished.append(animation)
+                continue
+
+            running.append(animation)
+
+        # Keep anything scheduled by `on_step` callbacks during the loop
+        running.extend(animations[count:])
+        self._animations = running
+
+        for animation in finished:
+            animation.finish()
 
     def schedule(self, animation: Animation) -> None:
-        """Starts an animation on the next step."""
+        """Starts an animation on the next step.
+
+        Animations that have nothing to do (zero duration, or an attribute that is
+        already at its endpoint) are stepped & finished immediately instead, so they
+        never make the animator active.
+        """
+
+        if animation.is_noop:
+            animation.step(0)
+            animation.finish()
+            return
 
         self._animations.append(animation)
 
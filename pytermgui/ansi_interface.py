@@ -298,6 +298,20 @@ def cursor_home() -> None:
     get_terminal().write("\x1b[H")
 
 
+_MODES = {
+    "reset": 0,
+    "bold": 1,
+    "dim": 2,
+    "italic": 3,
+    "underline": 4,
+    "blink": 5,
+    "inverse": 7,
+    "invisible": 8,
+    "strikethrough": 9,
+    "overline": 53,
+}
+
+
 def set_mode(mode: Union[str, int], write: bool = True) -> str:
     """Sets terminal display mode.
 
@@ -325,21 +339,9 @@ def set_mode(mode: Union[str, int], write: bool = True) -> str:
         - 53: overline
     """
 
-    options = {
-        "reset": 0,
-        "bold": 1,
-        "dim": 2,
-        "italic": 3,
-        "underline": 4,
-        "blink": 5,
-        "inverse": 7,
-        "invisible": 8,
-        "strikethrough": 9,
-        "overline": 53,
-    }
-
-    if not str(mode).isdigit():
-        mode = options[str(mode)]
+    mode = str(mode)
+    if not mode.isdigit():
+        mode = _MODES[mode]
 
     code = f"\x1b[{mode}m"
     if write:
@@ -629,10 +631,13 @@ def print_to(pos: tuple[int, int], *args: Any, **kwargs: Any) -> None:
     print(*args, **kwargs)
 
 
+_RESET = set_mode("reset", False)
+
+
 def reset() -> str:
     """Resets printing mode."""
 
-    return set_mode("reset", False)
+    return _RESET
 
 
 def bold(text: str, reset_style: Optional[bool] = True) -> str:
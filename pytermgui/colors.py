@@ -54,6 +54,8 @@ RE_PALETTE_REPLY = re.compile(
 
 PREVIEW_CHAR = "▄▀"
 
+_SGR_COLOR_CHARS = frozenset("0123456789;m")
+
 XTERM_NAMED_COLORS = {
     0: "ansi-black",
     1: "ansi-red",
@@ -86,10 +88,11 @@ _COLOR_MATCH_CACHE: dict[RGBTriplet, Color] = {}
 
 
 def clear_color_cache() -> None:
-    """Clears `_COLOR_CACHE` and `_COLOR_MATCH_CACHE`."""
+    """Clears `_COLOR_CACHE`, `_COLOR_MATCH_CACHE` and the `str_to_color` cache."""
 
     _COLOR_CACHE.clear()
     _COLOR_MATCH_CACHE.clear()
+    str_to_color.cache_clear()
 
 
 def _get_palette_color(color: Literal["10", "11"]) -> Color:
@@ -867,7 +870,7 @@ def str_to_color(
     def _trim_code(code: str) -> str:
         """Trims the given color code."""
 
-        if not all(char.isdigit() or char in "m;" for char in code):
+        if not _SGR_COLOR_CHARS.issuperset(code):
             return code
 
         is_background = code.startswith("48;")
@@ -895,7 +898,12 @@ def str_to_color(
         text = text[1:]
 
     if text in NAMED_COLORS:
-        return str_to_color(str(NAMED_COLORS[text]), is_background=is_background)
+        return str_to_color(
+            str(NAMED_COLORS[text]),
+            is_background=is_background,
+            localize=localize,
+            use_cache=use_cache,
+        )
 
     color: Color
 
@@ -7,8 +7,9 @@
 from __future__ import annotations
 
 import xml.dom.minidom as md
-from copy import deepcopy
-from html import escape
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
 from typing import Iterator
 
 from .colors import Color
@@ -65,6 +66,8 @@ TEXT_MARGIN_LEFT = 20
 TEXT_MARGIN_TOP = 35
 SVG_MARGIN_TOP = 20
 
+_SVG_RECT_HEIGHT = round(FONT_HEIGHT * 1.08, 2)
+
 SVG_FORMAT = f"""\
 <svg width="{{total_width}}" height="{{total_height}}"
     viewBox="0 0 {{total_width}} {{total_height}}" xmlns="http://www.w3.org/2000/svg">
@@ -99,8 +102,36 @@ _STYLE_TO_CSS = {
     "overline": "text-decoration: overline",
 }
 
+# Single-pass equivalent of `html.escape`, also replacing ' ' with &nbsp;.
+_ESCAPES = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "'": "&#x27;",
+        " ": "&#160;",
+    }
+)
+
+# Deletes all block characters (9600-9631) from a string.
+_BLOCK_REMOVER = str.maketrans("", "", "".join(map(chr, range(9600, 9632))))
+
+__all__ = ["ExportContext", "token_to_css", "to_html"]
+
 
-__all__ = ["token_to_css", "to_html"]
+@dataclass
+class ExportContext:
+    """Style deduplication state that can be shared between multiple exports.
+
+    Passing the same context to many `to_html` or `to_svg` calls means styles that
+    were already seen keep their class names, and don't need to be deduplicated
+    again. Each export's stylesheet contains every style known to the context at the
+    time, so all of its own classes are always defined.
+    """
+
+    document_styles: list[list[str]] = field(default_factory=list)
+    style_classes: dict[tuple[str, ...], str] = field(default_factory=dict)
 
 
 def prettify_xml(xml: str) -> str:
@@ -124,26 +155,49 @@ def _get_cls(prefix: str, index: int) -> str:
 def _generate_stylesheet(document_styles: list[list[str]], prefix: str | None) -> str:
     """Generates a '\\n' joined CSS stylesheet from the given styles."""
 
-    stylesheet = ""
     prefix = prefix or ""
 
-    for i, styles in enumerate(document_styles):
-        stylesheet += (
-            "\n        ." + _get_cls(prefix, i) + " {" + "; ".join(styles) + "}"
-        )
+    return "".join(
+        "\n        ." + _get_cls(prefix, i) + " {" + "; ".join(styles) + "}"
+        for i, styles in enumerate(document_styles)
+    )
 
-    return stylesheet
 
+def _get_style_class(
+    document_styles: list[list[str]],
+    style_classes: dict[tuple[str, ...], str],
+    styles: list[str],
+    prefix: str,
+) -> str:
+    """Returns the class name of the given styles, adding them to the document if new.
+
+    Args:
+        document_styles: The list of all unique styles in the document.
+        style_classes: A mapping of each prefix & style tuple to its class name, used
+            to avoid linear searches and rebuilding the same names.
+        styles: The styles to look up.
+        prefix: The class prefix, passed to `_get_cls`.
+    """
+
+    key = (prefix, *styles)
+    cls = style_classes.get(key)
 
-def _generate_index_in(lst: list[list[str]], item: list[str]) -> int:
-    """Returns the given item's index in the list, len(lst) if not found."""
+    if cls is None:
+        cls = style_classes[key] = _get_cls(prefix, len(document_styles))
+        document_styles.append(styles)
 
-    index = len(lst)
+    return cls
 
-    if item in lst:
-        return lst.index(item)
 
-    return index
+def _adjust_pos(
+    position: int | None, scale: float, offset: float, digits: int = 2
+) -> float:
+    """Adjusts a given position for the HTML canvas' scale."""
+
+    if position is None:
+        return 0
+
+    return round(position * scale + offset / FONT_SIZE, digits)
 
 
 # Note: This whole routine will be massively refactored in an upcoming update,
@@ -154,28 +208,19 @@ def _get_spans(  # pylint: disable=too-many-locals
     vertical_offset: float,
     horizontal_offset: float,
     include_background: bool,
-) -> Iterator[tuple[str, list[str]]]:
+) -> Iterator[tuple[str, str, list[str]]]:
     """Creates `span` elements from the given line, yields them with their styles.
 
     Args:
         line: The ANSI line of text to use.
 
     Yields:
-        Tuples of the span text (more on that later), and a list of CSS styles applied
-        to it.  The span text is in the format `<span{}>content</span>`, and it doesn't
-        yet have the styles formatted into it.
+        Tuples of the span's head & tail, and a list of CSS styles applied to it. The
+        style attribute, if any, goes in-between the head and the tail, e.g. for
+        `<span class='ptg-0'>content</span>` the head is `<span` and the tail is
+        `>content</span>`. Spans without styles are yielded complete in the head.
     """
 
-    def _adjust_pos(
-        position: int | None, scale: float, offset: float, digits: int = 2
-    ) -> float:
-        """Adjusts a given position for the HTML canvas' scale."""
-
-        if position is None:
-            return 0
-
-        return round(position * scale + offset / FONT_SIZE, digits)
-
     position = None
 
     for span in StyledText.group_styles(line):
@@ -186,7 +231,19 @@ def _get_spans(  # pylint: disable=too-many-locals
         has_link = False
         has_inverse = False
 
-        for token in sorted(span.tokens, key=lambda token: token.is_color()):
+        # Colors need to be handled last, so `inverse` can apply to them. This is done
+        # by partitioning rather than sorting, keeping the original order otherwise.
+        colors: list[Token] = []
+        others: list[Token] = []
+
+        for token in span.tokens:
+            if Token.is_color(token):
+                colors.append(token)
+                continue
+
+            others.append(token)
+
+        for token in chain(others, colors):
             if token.is_plain():
                 continue
 
@@ -194,7 +251,7 @@ def _get_spans(  # pylint: disable=too-many-locals
                 if token.value != position:
                     # Yield closer if there is already an active positioner
                     if position is not None:
-                        yield "</div>", []
+                        yield "</div>", "", []
 
                     adjusted = (
                         _adjust_pos(token.x, CHAR_WIDTH, horizontal_offset),
@@ -204,13 +261,13 @@ def _get_spans(  # pylint: disable=too-many-locals
                     yield (
                         "<div class='ptg-position'"
                         + f" style='left: {adjusted[0]}em; top: {adjusted[1]}em'>"
-                    ), []
+                    ), "", []
 
                     position = token.value
 
             elif token.is_hyperlink():
                 has_link = True
-                yield f"<a href='{token.value}'>", []
+                yield f"<a href='{token.value}'>", "", []
 
             elif token.is_style() and token.value == "inverse":
                 has_inverse = True
@@ -226,21 +283,25 @@ def _get_spans(  # pylint: disable=too-many-locals
             if css is not None and css not in styles:
                 styles.append(css)
 
-        escaped = (
-            escape(span.plain)
-            .replace("{", "{{")
-            .replace("}", "}}")
-            .replace(" ", "&#160;")
-        )
+        escaped = span.plain.translate(_ESCAPES)
 
         if len(styles) == 0:
-            yield f"<span>{escaped}</span>", []
+            yield f"<span>{escaped}</span>", "", []
             continue
 
-        tag = "<span{}>" + escaped + "</span>"
-        tag += "</a>" if has_link else ""
+        yield "<span", f">{escaped}</span>" + ("</a>" if has_link else ""), styles
+
+
+@lru_cache(maxsize=4096)
+def _color_to_css(hexcode: str, background: bool) -> str:
+    """Returns the CSS color rule for the given hex and color role."""
+
+    style = "color:" + hexcode
+
+    if background:
+        style = "background-" + style
 
-        yield tag, styles
+    return style
 
 
 def token_to_css(token: Token, invert: bool = False) -> str:
@@ -255,18 +316,11 @@ def token_to_css(token: Token, invert: bool = False) -> str:
     if Token.is_color(token):
         color = token.color
 
-        style = "color:" + color.hex
+        # Colors aren't hashable, so we cache based on their relevant properties.
+        return _color_to_css(color.hex, color.background != invert)
 
-        if invert:
-            color.background = not color.background
-
-        if color.background:
-            style = "background-" + style
-
-        return style
-
-    if token.is_style() and token.value in _STYLE_TO_CSS:
-        return _STYLE_TO_CSS[token.value]
+    if token.is_style():
+        return _STYLE_TO_CSS.get(token.value, "")
 
     return ""
 
@@ -282,6 +336,7 @@ def to_html(  # pylint: disable=too-many-arguments, too-many-locals
     horizontal_offset: float = 0.0,
     formatter: str = HTML_FORMAT,
     joiner: str = "\n",
+    context: ExportContext | None = None,
 ) -> str:
     """Creates a static HTML representation of the given object.
 
@@ -300,9 +355,12 @@ def to_html(  # pylint: disable=too-many-arguments, too-many-locals
             argument, otherwise a full style section is constructed.
         include_background: Whether to include the terminal's background color in the
             output.
+        context: If given, style deduplication state is read from & stored in it, so
+            it can be reused across exports.
     """
 
-    document_styles: list[list[str]] = []
+    context = context if context is not None else ExportContext()
+    document_styles, style_classes = context.document_styles, context.style_classes
 
     if isinstance(obj, Widget):
         data = obj.get_lines()
@@ -313,27 +371,38 @@ def to_html(  # pylint: disable=too-many-arguments, too-many-locals
     else:
         data = str(obj).splitlines()
 
+    cls_prefix = prefix or ""
+
     lines = []
     for dataline in data:
-        line = ""
+        parts: list[str] = []
+        open_divs = 0
 
-        for span, styles in _get_spans(
+        for head, tail, styles in _get_spans(
             dataline, vertical_offset, horizontal_offset, include_background
         ):
-            index = _generate_index_in(document_styles, styles)
-            if index == len(document_styles):
-                document_styles.append(styles)
+            cls = _get_style_class(document_styles, style_classes, styles, cls_prefix)
 
-            if inline_styles:
-                stylesheet = ";".join(styles)
-                line += span.format(f" styles='{stylesheet}'")
+            parts.append(head)
 
-            else:
-                line += span.format(" class='" + _get_cls(prefix or "", index) + "'")
+            if len(styles) > 0:
+                if inline_styles:
+                    parts.append(" styles='" + ";".join(styles) + "'")
+
+                else:
+                    parts.append(" class='" + cls + "'")
+
+            elif head == "</div>":
+                open_divs -= 1
+
+            elif head.startswith("<div"):
+                open_divs += 1
+
+            parts.append(tail)
 
         # Close any previously not closed divs
-        line += "</div>" * (line.count("<div") - line.count("</div"))
-        lines.append(line)
+        parts.append("</div>" * open_divs)
+        lines.append("".join(parts))
 
     stylesheet = ""
     if not inline_styles:
@@ -353,7 +422,7 @@ def to_html(  # pylint: disable=too-many-arguments, too-many-locals
 def _escape_text(text: str) -> str:
     """Escapes HTML and replaces ' ' with &nbsp;."""
 
-    return escape(text).replace(" ", "&#160;")
+    return text.translate(_ESCAPES)
 
 
 def _handle_tokens_svg(
@@ -382,11 +451,8 @@ def _handle_tokens_svg(
         if Token.is_color(token):
             color = token.color
 
-            if has_inverse:
-                color = deepcopy(color)
-                color.background = not color.background
-
-            if color.background:
+            # Inverse flips the role of every color, without touching the color itself.
+            if color.background != has_inverse:
                 back = color.hex
 
             else:
@@ -395,9 +461,10 @@ def _handle_tokens_svg(
             continue
 
         if Token.is_clear(token):
-            for i, (target, _) in enumerate(styles):
-                if token.targets(target):
-                    styles.pop(i)
+            styles = [
+                (target, value) for target, value in styles if not token.targets(target)
+            ]
+            continue
 
         css = token_to_css(token)
 
@@ -410,6 +477,29 @@ def _handle_tokens_svg(
     return (None if pos is None else (pos[0] or 0, pos[1] or 0)), back, css_styles
 
 
+@lru_cache(maxsize=1024)
+def _is_block(text: str) -> bool:
+    """Determines whether the given text only contains block characters.
+
+    These characters reside in the unicode range of 9600-9631, which is what we test
+    against.
+    """
+
+    return text.translate(_BLOCK_REMOVER) == ""
+
+
+@lru_cache(maxsize=1024)
+def _get_svg_widths(length: int) -> tuple[float, float, float]:
+    """Returns the text length, rect width & text width of a line of the given length.
+
+    The latter two are rounded for output, the first one is used for positioning.
+    """
+
+    text_len = length * FONT_WIDTH
+
+    return text_len, round(text_len * 1.02, 2), round(text_len, 2)
+
+
 def _slugify(text: str) -> str:
     """Turns the given text into a slugified form."""
 
@@ -448,6 +538,7 @@ def to_svg(  # pylint: disable=too-many-locals, too-many-arguments, too-many-sta
     inline_styles: bool = False,
     title: str = "PyTermGUI",
     formatter: str = SVG_FORMAT,
+    context: ExportContext | None = None,
 ) -> str:
     """Creates an SVG screenshot of the given object.
 
@@ -466,28 +557,22 @@ def to_svg(  # pylint: disable=too-many-locals, too-many-arguments, too-many-sta
         title: A string to display in the top bar of the fake terminal.
         formatter: The formatting string to use. Inspect `pytermgui.exporters.SVG_FORMAT`
             to see all of its arguments.
+        context: If given, style deduplication state is read from & stored in it, so
+            it can be reused across exports.
     """
 
-    def _is_block(text: str) -> bool:
-        """Determines whether the given text only contains block characters.
-
-        These characters reside in the unicode range of 9600-9631, which is what we test
-        against.
-        """
-
-        return all(9600 <= ord(char) <= 9631 for char in text)
-
     prefix = prefix if prefix is not None else "ptg"
 
     terminal = get_terminal()
     default_fore = Color.get_default_foreground().hex
     default_back = Color.get_default_background().hex
 
-    text = ""
+    text_parts: list[str] = []
 
     lines = 1
     cursor_x = cursor_y = 0.0
-    document_styles: list[list[str]] = []
+    context = context if context is not None else ExportContext()
+    document_styles, style_classes = context.document_styles, context.style_classes
 
     # We manually set all text to have an alignment-baseline of
     # text-after-edge to avoid block characters rendering in the
@@ -510,15 +595,12 @@ def to_svg(  # pylint: disable=too-many-locals, too-many-arguments, too-many-sta
 
         pos, back, styles = _handle_tokens_svg(plain, default_fore, default_back)
 
-        index = _generate_index_in(document_styles, styles)
-
-        if index == len(document_styles):
-            document_styles.append(styles)
+        cls = _get_style_class(document_styles, style_classes, styles, prefix)
 
         style_attr = (
             f"class='{prefix}' style='{';'.join(styles)}'"
             if inline_styles
-            else f"class='{prefix} {_get_cls(prefix, index)}'"
+            else f"class='{prefix} {cls}'"
         )
 
         # Manual positioning
@@ -527,7 +609,7 @@ def to_svg(  # pylint: disable=too-many-locals, too-many-arguments, too-many-sta
             cursor_y = pos[1] * FONT_HEIGHT - 15
 
         for line in plain.plain.splitlines():
-            text_len = len(line) * FONT_WIDTH
+            text_len, rect_width, text_width = _get_svg_widths(len(line))
 
             if should_newline:
                 cursor_y += FONT_HEIGHT
@@ -537,23 +619,18 @@ def to_svg(  # pylint: disable=too-many-locals, too-many-arguments, too-many-sta
                 if lines > terminal.height:
                     break
 
-            text += _make_tag(
-                "rect",
-                x=cursor_x,
-                y=cursor_y - (baseline_offset if not _is_block(line) else 0),
-                fill=back or default_back,
-                width=round(text_len * 1.02, 4),
-                height=round(FONT_HEIGHT * 1.08, 4),
+            x = round(cursor_x, 2)
+            rect_y = cursor_y - (baseline_offset if not _is_block(line) else 0)
+
+            text_parts.append(
+                f"<rect x='{x}' y='{round(rect_y, 2)}' fill='{back or default_back}'"
+                + f" width='{rect_width}' height='{_SVG_RECT_HEIGHT}'></rect>"
             )
 
-            text += _make_tag(
-                "text",
-                _escape_text(line),
-                dy="-0.25em",
-                x=cursor_x,
-                y=cursor_y + FONT_SIZE,
-                textLength=text_len,
-                raw=style_attr,
+            text_parts.append(
+                f"<text dy='-0.25em' x='{x}' y='{round(cursor_y + FONT_SIZE, 2)}'"
+                + f" textLength='{text_width}' {style_attr}>"
+                + f"{_escape_text(line)}</text>"
             )
 
             cursor_x += text_len
@@ -602,7 +679,7 @@ def to_svg(  # pylint: disable=too-many-locals, too-many-arguments, too-many-sta
         chrome_part = f"""<rect width="{total_width}" height="{total_height}"
             fill="{default_back}" />"""
 
-    output = _make_tag("g", text, transform=transform) + "\n"
+    output = _make_tag("g", "".join(text_parts), transform=transform) + "\n"
 
     return prettify_xml(
         formatter.format(
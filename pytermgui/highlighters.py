@@ -111,10 +111,8 @@ class RegexHighlighter:
         def _insert_style(matchobj: Match) -> str:
             """Returns the match inserted into a markup style."""
 
-            groups = matchobj.groupdict()
-
             name = matchobj.lastgroup
-            content = groups.get(str(name), None)
+            content = matchobj[name] if name is not None else None
 
             if self.match_formatter is not None:
                 content = self.match_formatter(matchobj, content)
@@ -123,9 +121,8 @@ class RegexHighlighter:
                     return ""
 
             tag = f"{self.prefix}{name}"
-            style = f"[{tag}]{{}}[/{tag}]"
 
-            return style.format(content)
+            return f"[{tag}]{content}[/{tag}]"
 
         text = self._pattern.sub(_insert_style, text)
         self._highlight_cache[cache_key] = text
@@ -147,70 +144,73 @@ class RegexHighlighter:
         yield ">"
 
 
-def highlight_tim(text: str, cache: bool = True) -> str:
-    """Highlights some TIM code."""
+@lru_cache(1048)
+def _highlight_tim(txt: str) -> str:
+    """Highlights some TIM code, see `highlight_tim`."""
 
-    @lru_cache(1048)
-    def _highlight(txt: str) -> str:
-        output = ""
-        cursor = 0
-        active_tokens: list[Token] = []
+    output: list[str] = []
+    cursor = 0
+    active_tokens: list[Token] = []
 
-        def _get_active_markup() -> str:
-            active_markup = " ".join(tkn.markup for tkn in active_tokens)
+    def _get_active_markup() -> str:
+        active_markup = " ".join(tkn.markup for tkn in active_tokens)
 
-            if active_markup == "":
-                return ""
+        if active_markup == "":
+            return ""
 
-            return f"[{active_markup}]"
+        return f"[{active_markup}]"
 
-        for matchobj in RE_MARKUP.finditer(txt):
-            start, end = matchobj.span()
+    for matchobj in RE_MARKUP.finditer(txt):
+        start, end = matchobj.span()
 
-            if cursor < start:
-                if cursor > 0:
-                    output += "]"
+        if cursor < start:
+            if cursor > 0:
+                output.append("]")
 
-                output += _get_active_markup()
-                output += f"{txt[cursor:start]}[/]"
+            output.append(_get_active_markup())
+            output.append(f"{txt[cursor:start]}[/]")
 
-            *_, tags = matchobj.groups()
+        *_, tags = matchobj.groups()
 
-            output += "["
-            for tag in tags.split():
-                token = consume_tag(tag)
-                output += f"{token.prettified_markup} "
+        prettified: list[str] = []
+        for tag in tags.split():
+            token = consume_tag(tag)
+            prettified.append(token.prettified_markup)
 
-                if Token.is_clear(token):
-                    active_tokens = [
-                        tkn for tkn in active_tokens if not token.targets(tkn)
-                    ]
+            if Token.is_clear(token):
+                active_tokens = [tkn for tkn in active_tokens if not token.targets(tkn)]
 
-                else:
-                    active_tokens.append(token)
+            else:
+                active_tokens.append(token)
 
-            output = output.rstrip()
-            cursor = end
+        output.append("[" + " ".join(prettified))
+        cursor = end
 
-        if cursor < len(txt) - 1:
-            if cursor > 0:
-                output += "]"
+    if cursor < len(txt) - 1:
+        if cursor > 0:
+            output.append("]")
 
-            output += _get_active_markup()
-            output += f"{txt[cursor:]}"
+        output.append(_get_active_markup())
+        output.append(txt[cursor:])
 
-            if len(active_tokens) > 0:
-                output += "[/]"
+        if len(active_tokens) > 0:
+            output.append("[/]")
 
-        if output.count("[") != output.count("]"):
-            output += "]"
+    highlighted = "".join(output)
 
-        return output
+    if highlighted.count("[") != highlighted.count("]"):
+        highlighted += "]"
+
+    return highlighted
+
+
+def highlight_tim(text: str, cache: bool = True) -> str:
+    """Highlights some TIM code."""
 
     if cache:
-        return _highlight(text)
+        return _highlight_tim(text)
 
-    return _highlight.__wrapped__(text)
+    return _highlight_tim.__wrapped__(text)
 
 
 _BUILTIN_NAMES = "|".join(f"(?:{item})" for item in dir(builtins))
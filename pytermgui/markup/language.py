@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 from functools import cached_property
-from typing import Callable, Generator, Iterator, Match
+from typing import Callable, Generator, Iterator
 
 from ..colors import Color, ColorSyntaxError, str_to_color
 from ..regex import RE_MARKUP
@@ -18,10 +18,10 @@ from .parsing import (
     MacroType,
     create_context_dict,
     eval_alias,
+    get_markup,
     parse_tokens,
     tokenize_ansi,
     tokenize_markup,
-    tokens_to_markup,
 )
 from .style_maps import CLEARERS
 from .tokens import Token
@@ -41,12 +41,10 @@ Tokenizer = Callable[[str], Iterator[Token]]
 def escape(text: str) -> str:
     """Escapes any markup found within the given text."""
 
-    def _repl(matchobj: Match) -> str:
-        full, *_ = matchobj.groups()
+    if "[" not in text:
+        return text
 
-        return f"\\{full}"
-
-    return RE_MARKUP.sub(_repl, text)
+    return RE_MARKUP.sub(r"\\\1", text)
 
 
 class MarkupLanguage:
@@ -261,7 +259,7 @@ class MarkupLanguage:
         This function does not use context, and thus is out of place here.
         """
 
-        return tokens_to_markup(list(tokenize_ansi(text)))
+        return get_markup(text)
 
     def group_styles(
         self, text: str, tokenizer: Tokenizer = tokenize_ansi
@@ -338,71 +336,65 @@ class StyledText:
 
         return colors[-1].color
 
+    @cached_property
+    def _styles(self) -> frozenset[str]:
+        """Returns the names of all styles applied to this object."""
+
+        return frozenset(tkn.markup for tkn in self.tokens if Token.is_style(tkn))
+
     @cached_property
     def bold(self) -> bool:
         """Returns this text is bold."""
 
-        return any(Token.is_style(tkn) and tkn.markup == "bold" for tkn in self.tokens)
+        return "bold" in self._styles
 
     @cached_property
     def dim(self) -> bool:
         """Returns this text is dimmed."""
 
-        return any(Token.is_style(tkn) and tkn.markup == "dim" for tkn in self.tokens)
+        return "dim" in self._styles
 
     @cached_property
     def italic(self) -> bool:
         """Returns this text is italicized."""
 
-        return any(
-            Token.is_style(tkn) and tkn.markup == "italic" for tkn in self.tokens
-        )
+        return "italic" in self._styles
 
     @cached_property
     def underline(self) -> bool:
         """Returns this text is underlined."""
 
-        return any(
-            Token.is_style(tkn) and tkn.markup == "underline" for tkn in self.tokens
-        )
+        return "underline" in self._styles
 
     @cached_property
     def blink(self) -> bool:
         """Returns this text is blinking."""
 
-        return any(Token.is_style(tkn) and tkn.markup == "blink" for tkn in self.tokens)
+        return "blink" in self._styles
 
     @cached_property
     def blink2(self) -> bool:
         """Returns this text is alternate-blinking."""
 
-        return any(
-            Token.is_style(tkn) and tkn.markup == "blink2" for tkn in self.tokens
-        )
+        return "blink2" in self._styles
 
     @cached_property
     def strikethrough(self) -> bool:
         """Returns this text is striked out."""
 
-        return any(
-            Token.is_style(tkn) and tkn.markup == "strikethrough" for tkn in self.tokens
-        )
+        return "strikethrough" in self._styles
 
     @cached_property
     def inverse(self) -> bool:
         """Returns this text has its colors inversed."""
 
-        return any(
-            Token.is_style(tkn) and tkn.markup == "inverse" for tkn in self.tokens
-        )
+        return "inverse" in self._styles
 
     @cached_property
     def overline(self) -> bool:
         """Returns this text is overlined."""
 
-        return any(
-            Token.is_style(tkn) and tkn.markup == "overline" for tkn in self.tokens
-        )
+        return "overline" in self._styles
 
     @staticmethod
     def group_styles(
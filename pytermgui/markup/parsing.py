@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from typing import Callable, Iterator, Protocol, TypedDict, List
 from warnings import filterwarnings, warn
 
 from ..colors import Color
 from ..exceptions import ColorSyntaxError, MarkupSyntaxError
-from ..regex import RE_MACRO, RE_MARKUP
+from ..regex import RE_MACRO
 from .style_maps import CLEARERS, REVERSE_CLEARERS, REVERSE_STYLES, STYLES
 from .tokens import (
     AliasToken,
@@ -89,11 +90,34 @@ def create_context_dict() -> ContextDict:
     return {"aliases": {}, "macros": {}}
 
 
+# Tokens for all fixed-name tags, so these can be resolved with a single lookup.
+# Tokens are immutable, so it is safe to share these instances.
+_STATIC_TOKENS: dict[str, Token] = {
+    **{tag: StyleToken(tag) for tag in STYLES},
+    **{tag: ClearToken(tag) for tag in CLEARERS},
+    **{tag: PseudoToken(tag) for tag in PSEUDO_TOKENS},
+}
+
+# The SGR sequence of every style & clearer, keyed by tag name. Clearers always
+# start with a slash, so the two can't collide.
+_SGR_SEQUENCES = {tag: f"\x1b[{code}m" for tag, code in {**STYLES, **CLEARERS}.items()}
+
+# The number of parameters following each extended (38/48) color mode.
+_EXTENDED_COLOR_LENGTHS = {"5": 1, "2": 3}
+
+# The same shared tokens, keyed by the SGR parameter that produces them.
+_SGR_TOKENS: dict[str, Token] = {
+    **{code: _STATIC_TOKENS[tag] for code, tag in REVERSE_STYLES.items()},
+    **{code: _STATIC_TOKENS[tag] for code, tag in REVERSE_CLEARERS.items()},
+}
+
+
 def consume_tag(tag: str) -> Token:  # pylint: disable=too-many-return-statements
     """Consumes a tag text, returns the associated Token."""
 
-    if tag in STYLES:
-        return StyleToken(tag)
+    static = _STATIC_TOKENS.get(tag)
+    if static is not None:
+        return static
 
     if tag.startswith("/"):
         return ClearToken(tag)
@@ -123,12 +147,9 @@ def consume_tag(tag: str) -> Token:  # pylint: disable=too-many-return-statement
 
         return CursorToken(tag[1:-1], *map(int, values))
 
-    if tag in PSEUDO_TOKENS:
-        return PseudoToken(tag)
-
     token: Token
     try:
-        token = ColorToken(tag, Color.parse(tag, localize=False))
+        token = ColorToken(tag, Color.parse(tag, localize=False, use_cache=True))
 
     except ColorSyntaxError:
         token = AliasToken(tag)
@@ -137,6 +158,56 @@ def consume_tag(tag: str) -> Token:  # pylint: disable=too-many-return-statement
         return token  # pylint: disable=lost-exception
 
 
+def _scan_markup(text: str) -> Iterator[tuple[int, int, int, int]]:
+    """Finds all tag groups within some markup.
+
+    This is a hand-written equivalent of `RE_MARKUP.finditer`, built on top of
+    `str.find` so that the scanning happens in C.
+
+    Args:
+        text: Any valid markup.
+
+    Yields:
+        Tuples of the group's start (including escaping backslashes), the position
+        of its opening bracket, the position of its closing bracket and its end.
+    """
+
+    cursor = 0
+    search = 0
+
+    while True:
+        opener = text.find("[", search)
+        if opener == -1:
+            return
+
+        closer = text.find("]", opener + 1)
+        if closer == -1:
+            return
+
+        # Groups cannot contain brackets, so restart from the innermost opener
+        inner = text.rfind("[", opener + 1, closer)
+        if inner != -1:
+            opener = inner
+
+        start = opener
+        while start > cursor and text[start - 1] == "\\":
+            start -= 1
+
+        cursor = search = closer + 1
+        yield start, opener, closer, cursor
+
+
+@lru_cache(maxsize=1024)
+def _consume_tag_group(group: str) -> tuple[Token, ...]:
+    """Consumes every tag within the body of a tag group.
+
+    Tag groups tend to repeat a lot within the same markup, so their tokens are
+    cached to avoid splitting & dispatching the same tags over and over.
+    """
+
+    return tuple(consume_tag(tag) for tag in group.split())
+
+
 def tokenize_markup(text: str) -> Iterator[Token]:
     """Converts some markup text into a stream of tokens.
 
@@ -147,41 +218,26 @@ def tokenize_markup(text: str) -> Iterator[Token]:
         The generated tokens, in the order they occur within the markup.
     """
 
+    # Every tag group needs an opening bracket, so there is nothing to scan for.
+    if "[" not in text:
+        if len(text) > 0:
+            yield PlainToken(text)
+
+        return
+
     cursor = 0
     length = len(text)
-    has_inverse = False
-    for matchobj in RE_MARKUP.finditer(text):
-        full, escapes, content = matchobj.groups()
-        start, end = matchobj.span()
-
+    for start, opener, closer, end in _scan_markup(text):
         if cursor < start:
             yield PlainToken(text[cursor:start])
 
-        if not escapes == "":
-            _, remaining = divmod(len(escapes), 2)
-
-            yield PlainToken(full[max(1 - remaining, 1) :])
+        if start != opener:
+            yield PlainToken(text[start + 1 : end])
             cursor = end
 
             continue
 
-        for tag in content.split():
-            if tag == "inverse":
-                has_inverse = True
-
-            if tag == "/inverse":
-                has_inverse = False
-
-            consumed = consume_tag(tag)
-            if has_inverse:
-                if consumed.markup == "/fg":
-                    consumed = ClearToken("/fg")
-
-                elif consumed.markup == "/bg":
-                    consumed = ClearToken("/bg")
-
-            yield consumed
-
+        yield from _consume_tag_group(text[opener + 1 : closer])
         cursor = end
 
     if cursor < length:
@@ -199,61 +255,54 @@ def _tokenize_ansi_color(
     Yields:
         The generated tokens
     """
-    state = None
-    color_code = ""
-    for part in params:
-        if state is None:
-            if part in REVERSE_STYLES:
-                yield StyleToken(REVERSE_STYLES[part])
-                continue
 
-            if part in REVERSE_CLEARERS:
-                yield ClearToken(REVERSE_CLEARERS[part])
-                continue
+    index = 0
+    count = len(params)
 
-            if part in ("38", "48"):
-                state = "COLOR"
-                color_code += part + ";"
-                continue
+    while index < count:
+        part = params[index]
+        index += 1
 
-            # standard colors
-            try:
-                yield ColorToken(part, Color.parse(part, localize=False))
-                continue
-
-            except ColorSyntaxError as exc:
-                raise ValueError(f"Could not parse color tag {part!r}.") from exc
-
-        if state != "COLOR":
+        token = _SGR_TOKENS.get(part)
+        if token is not None:
+            yield token
             continue
 
-        color_code += part + ";"
+        if part in ("38", "48"):
+            mode = params[index] if index < count else ""
+            length = _EXTENDED_COLOR_LENGTHS.get(mode)
 
-        # Ignore incomplete RGB colors
-        if (
-            color_code.startswith(("38;2;", "48;2;"))
-            and len(color_code.split(";")) != 6
-        ):
-            continue
+            # Without a known mode we can't tell where the color ends
+            if length is None:
+                return
 
-        try:
-            code = color_code
+            values = params[index + 1 : index + 1 + length]
+            index += 1 + length
 
-            if code.startswith(("38;2;", "48;2;", "38;5;", "48;5;")):
-                stripped = code[5:-1]
+            # Ignore incomplete colors
+            if len(values) != length:
+                return
 
-                if code.startswith("4"):
-                    stripped = "@" + stripped
+            code = ";".join(values)
+            if part == "48":
+                code = "@" + code
 
-                code = stripped
+            try:
+                yield ColorToken(
+                    code, Color.parse(code, localize=False, use_cache=True)
+                )
 
-            yield ColorToken(code, Color.parse(code, localize=False))
+            except ColorSyntaxError:
+                pass
 
-        except ColorSyntaxError:
             continue
 
-        state = None
-        color_code = ""
+        # standard colors
+        try:
+            yield ColorToken(part, Color.parse(part, localize=False, use_cache=True))
+
+        except ColorSyntaxError as exc:
+            raise ValueError(f"Could not parse color tag {part!r}.") from exc
 
 
 ESC="\x1b"
@@ -281,6 +330,14 @@ def tokenize_ansi(  # pylint: disable=too-many-locals, too-many-branches, too-ma
         The generated tokens, in the order they occur within the text.
     """
 
+    # Plain text is by far the most common input, no need to run it through the
+    # state machine character by character.
+    if ESC not in text:
+        if len(text) > 0:
+            yield PlainToken(text)
+
+        return
+
     ## State machine status
 
 
@@ -292,7 +349,25 @@ def tokenize_ansi(  # pylint: disable=too-many-locals, too-many-branches, too-ma
 
     escaping = False
 
-    for char in text:
+    index = 0
+    length = len(text)
+
+    while index < length:
+        # Jump straight to the next escape sequence, plain text can't contain any
+        if cstate is None and not escaping:
+            end = text.find(ESC, index)
+            if end == -1:
+                end = length
+
+            accumulator += text[index:end]
+            index = end
+
+            if index == length:
+                break
+
+        char = text[index]
+        index += 1
+
         if char == ESC:
             if cstate is None and len(accumulator) > 0:
                 yield PlainToken(accumulator)
@@ -386,15 +461,15 @@ def eval_alias(text: str, context: ContextDict) -> str:
 
     aliases = context["aliases"]
 
-    evaluated = ""
+    evaluated = []
     for tag in text.split():
         if tag not in aliases:
-            evaluated += tag + " "
+            evaluated.append(tag)
             continue
 
-        evaluated += eval_alias(aliases[tag], context) + " "
+        evaluated.append(eval_alias(aliases[tag], context))
 
-    return evaluated.rstrip(" ")
+    return " ".join(evaluated).rstrip(" ")
 
 
 def parse_plain(token: PlainToken, _: ContextDict, __: Callable[[], str]) -> str:
@@ -412,9 +487,7 @@ def parse_color(token: ColorToken, _: ContextDict, __: Callable[[], str]) -> str
 def parse_style(token: StyleToken, _: ContextDict, __: Callable[[], str]) -> str:
     """Parses a style token."""
 
-    index = STYLES[token.value]
-
-    return f"\x1b[{index}m"
+    return _SGR_SEQUENCES[token.value]
 
 
 def parse_macro(
@@ -462,13 +535,13 @@ def parse_clear(token: ClearToken, _: ContextDict, get_full: Callable[[], str])
     if token.value == "/~":
         return "\x1b]8;;\x1b\\"
 
-    index = CLEARERS.get(token.value)
-    if index is None:
+    sequence = _SGR_SEQUENCES.get(token.value)
+    if sequence is None:
         raise MarkupSyntaxError(
             token.value, "not a recognized clearer or alias", get_full()
         )
 
-    return f"\x1b[{index}m"
+    return sequence
 
 
 def parse_cursor(token: CursorToken, _: ContextDict, __: Callable[[], str]) -> str:
@@ -624,14 +697,14 @@ def tokens_to_markup(tokens: list[Token]) -> str:
     """
 
     tags: list[Token] = []
-    markup = ""
+    markup: list[str] = []
 
     for token in tokens:
         if token.is_plain():
             if len(tags) > 0:
-                markup += f"[{' '.join(tag.markup for tag in tags)}]"
+                markup.append(f"[{' '.join(tag.markup for tag in tags)}]")
 
-            markup += token.value
+            markup.append(token.value)
 
             tags = []
 
@@ -639,13 +712,17 @@ def tokens_to_markup(tokens: list[Token]) -> str:
             tags.append(token)
 
     if len(tags) > 0:
-        markup += f"[{' '.join(tag.markup for tag in tags)}]"
+        markup.append(f"[{' '.join(tag.markup for tag in tags)}]")
 
-    return markup
+    return "".join(markup)
 
 
+@lru_cache(maxsize=1024)
 def get_markup(text: str) -> str:
-    """Gets the markup representing an ANSI-coded string."""
+    """Gets the markup representing an ANSI-coded string.
+
+    As this conversion doesn't depend on any context, its results are cached.
+    """
 
     return tokens_to_markup(list(tokenize_ansi(text)))
 
@@ -785,13 +862,18 @@ def parse_tokens(  # pylint: disable=too-many-branches, too-many-locals, too-man
     if optimize:
         token_list = list(optimize_tokens(token_list))
 
-    if append_reset:
+    # Markup that already ends in a full reset doesn't need another one
+    if append_reset and not (
+        len(token_list) > 0
+        and Token.is_clear(token_list[-1])
+        and token_list[-1].value == "/"
+    ):
         token_list.append(ClearToken("/"))
 
     link = None
-    output = ""
-    segment = ""
-    background = Color.parse("#000000")
+    output: list[str] = []
+    segment: list[str] = []
+    background = Color.parse("#000000", use_cache=True)
     macros: list[MacroToken] = []
     unknown_aliases: list[Token] = []
 
@@ -804,14 +886,15 @@ def parse_tokens(  # pylint: disable=too-many-branches, too-many-locals, too-man
             )
 
             if len(unknown_aliases) > 0:
-                output += f"[{' '.join(tkn.value for tkn in unknown_aliases)}]"
+                output.append(f"[{' '.join(tkn.value for tkn in unknown_aliases)}]")
                 unknown_aliases = []
 
-            output += segment + (
+            output.extend(segment)
+            output.append(
                 value if link is None else LINK_TEMPLATE.format(uri=link, label=value)
             )
 
-            segment = ""
+            segment = []
             continue
 
         if token.is_hyperlink():
@@ -849,14 +932,18 @@ def parse_tokens(  # pylint: disable=too-many-branches, too-many-locals, too-man
 
         if Token.is_pseudo(token):
             if token.value in STATE_PSEUDOS:
-                segment += parse_state_pseudo(token, tokens, i, save_state, context)
+                segment.append(
+                    parse_state_pseudo(token, tokens, i, save_state, context)
+                )
                 continue
 
             if token.value == "#auto":
                 token = ColorToken("#auto", background.contrast)
 
         try:
-            segment += PARSERS[type(token)](token, context, get_full)  # type: ignore
+            segment.append(
+                PARSERS[type(token)](token, context, get_full)  # type: ignore
+            )
 
         except MarkupSyntaxError:
             if not ignore_unknown_tags:
@@ -865,11 +952,11 @@ def parse_tokens(  # pylint: disable=too-many-branches, too-many-locals, too-man
             unknown_aliases.append(token)
 
     if len(unknown_aliases) > 0:
-        output += f"[{' '.join(tkn.value for tkn in unknown_aliases)}]"
+        output.append(f"[{' '.join(tkn.value for tkn in unknown_aliases)}]")
 
-    output += segment
+    output.extend(segment)
 
-    return output
+    return "".join(output)
 
 
 def parse(
@@ -899,9 +986,6 @@ def parse(
     if context is None:
         context = create_context_dict()
 
-    if append_reset and not text.endswith("/]"):
-        text += "[/]"
-
     tokens = list(tokenize_markup(text))
 
     return parse_tokens(
@@ -2,10 +2,11 @@
 
 import re
 from functools import lru_cache
-from typing import Match
 
 RE_LINK = re.compile(r"(?:\x1b\]8;;([^\\]*)\x1b\\([^\\]*?)\x1b\]8;;\x1b\\)")
-RE_ANSI = re.compile(r"(?:\x1b\[(.*?)[mH])|(?:\x1b\](.*?)\x1b\\)|(?:\x1b_G(.*?)\x1b\\)")
+RE_ANSI = re.compile(
+    r"(?:\x1b\[([^mH\n]*)[mH])|(?:\x1b\](.*?)\x1b\\)|(?:\x1b_G(.*?)\x1b\\)"
+)
 RE_MACRO = re.compile(r"(![a-z0-9_\-]+)(?:\(([\w\/\.?\-=:]+)\))?")
 RE_MARKUP = re.compile(r"((\\*)\[([^\[\]]*)\])")
 RE_PIXEL_SIZE = re.compile(r"\x1b\[4;([\d]+);([\d]+)t")
@@ -36,6 +37,9 @@ def strip_ansi(text: str) -> str:
     if hasattr(text, "plain"):
         return text.plain  # type: ignore
 
+    if "\x1b" not in text:
+        return text
+
     return RE_ANSI.sub("", text)
 
 
@@ -76,12 +80,10 @@ def escape_markup(text: str) -> str:
     Use this when treating already parsed markup.
     """
 
-    def _escape(mtch: Match) -> str:
-        full, *_ = mtch.groups()
-
-        return full.replace("[", r"\[")
+    if "[" not in text:
+        return text
 
-    return RE_MARKUP.sub(_escape, text)
+    return RE_MARKUP.sub(r"\2\\[\3]", text)
 
 
 @lru_cache(maxsize=1024)
@@ -176,11 +176,14 @@ class ColorSystem(Enum):
     TRUE = 2
     """'True' color, a.k.a. 24-bit RGB colors."""
 
+    # These comparisons run every time a color is localized, so they read the
+    # member values directly instead of going through the `value` descriptor.
+    # pylint: disable=protected-access, no-member
     def __ge__(self, other):
         """Comparison: self >= other."""
 
         if self.__class__ is other.__class__:
-            return self.value >= other.value
+            return self._value_ >= other._value_
 
         return NotImplemented
 
@@ -188,7 +191,7 @@ class ColorSystem(Enum):
         """Comparison: self > other."""
 
         if self.__class__ is other.__class__:
-            return self.value > other.value
+            return self._value_ > other._value_
 
         return NotImplemented
 
@@ -196,7 +199,7 @@ class ColorSystem(Enum):
         """Comparison: self <= other."""
 
         if self.__class__ is other.__class__:
-            return self.value <= other.value
+            return self._value_ <= other._value_
 
         return NotImplemented
 
@@ -204,10 +207,12 @@ class ColorSystem(Enum):
         """Comparison: self < other."""
 
         if self.__class__ is other.__class__:
-            return self.value < other.value
+            return self._value_ < other._value_
 
         return NotImplemented
 
+    # pylint: enable=protected-access, no-member
+
 
 def _get_env_colorsys() -> ColorSystem | None:
     """Gets a colorsystem if the `PTG_COLOR_SYSTEM` env var can be linked to one."""
@@ -259,7 +264,7 @@ class Terminal:  # pylint: disable=too-many-instance-attributes
         self._recorder: Recorder | None = None
 
         self.size: tuple[int, int] = self._get_size()
-        self.forced_colorsystem: ColorSystem | None = _get_env_colorsys()
+        self._forced_colorsystem: ColorSystem | None = _get_env_colorsys()
 
         self._listeners: dict[int, list[Callable[..., Any]]] = {}
 
@@ -391,8 +396,14 @@ class Terminal:  # pylint: disable=too-many-instance-attributes
     def forced_colorsystem(self, new: ColorSystem | None) -> None:
         """Sets a colorsystem, clears colorsystem cache."""
 
+        # pylint: disable-next=import-outside-toplevel
+        from .colors import clear_color_cache
+
         self._forced_colorsystem = new
 
+        # Localized colors were matched against the previous colorsystem
+        clear_color_cache()
+
     @property
     def colorsystem(self) -> ColorSystem:
         """Gets the current terminal's supported color system."""
@@ -1074,8 +1074,9 @@ class Splitter(Container):
             vertical_lines.append(inner)
 
         lines = []
+        joiner = reset() + separator
         for horizontal in zip_longest(*vertical_lines, fillvalue=" " * target_width):
-            lines.append((reset() + separator).join(horizontal))
+            lines.append(joiner.join(horizontal))
 
         self.height = max(widget.height for widget in self)
         return lines
@@ -112,3 +112,149 @@ def test_animation_finishes_on_step():
 
     ptg.animator.step(1)
     assert not ptg.animator.is_active
+
+
+def test_animator_removes_finished_by_identity():
+    _reset()
+
+    def _on_step(anim: ptg.animations.Animation) -> bool:
+        return anim is second
+
+    first = ptg.animator.animate_float(duration=1000, on_step=_on_step)
+    second = ptg.animator.animate_float(duration=1000, on_step=_on_step)
+
+    ptg.animator.step(0.1)
+
+    # Both are equal by value, but only the later one has finished
+    assert first == second
+    assert any(anim is first for anim in ptg.animator._animations)
+    assert not any(anim is second for anim in ptg.animator._animations)
+
+
+def test_animator_keeps_rescheduled_instance():
+    _reset()
+
+    finished = []
+
+    def _reschedule(anim: ptg.animations.Animation) -> None:
+        finished.append(anim)
+
+        if len(finished) < 3:
+            anim._remaining = anim.duration
+            ptg.animator.schedule(anim)
+
+    ptg.animator.animate_float(duration=100, on_finish=_reschedule)
+
+    for _ in range(5):
+        ptg.animator.step(0.2)
+
+    assert len(finished) == 3
+    assert not ptg.animator.is_active
+
+
+def test_animation_zero_duration():
+    _reset()
+
+    forward = ptg.animator.animate_float(duration=0)
+    backward = ptg.animator.animate_float(duration=0, direction=-1)
+
+    assert forward.state == 1.0
+    assert backward.state == 0.0
+    assert not ptg.animator.is_active
+
+
+def test_animate_attr_skips_unchanged_values():
+    _reset()
+
+    writes = []
+
+    class _Target:
+        def __init__(self) -> None:
+            self._value = 0
+
+        @property
+        def value(self) -> int:
+            return self._value
+
+        @value.setter
+        def value(self, new: int) -> None:
+            writes.append(new)
+            self._value = new
+
+    target = _Target()
+    ptg.animator.animate_attr(target=target, attr="value", end=2, duration=1000)
+
+    for _ in range(10):
+        ptg.animator.step(0.05)
+
+    assert writes == [0, 1]
+
+
+def test_animate_attr_easing():
+    _reset()
+
+    def _ease_in(progress: float) -> float:
+        return progress**2
+
+    target = MyTarget()
+    ptg.animator.animate_attr(
+        target=target,
+        attr="test_attr",
+        start=0,
+        end=100,
+        duration=1000,
+        easing=_ease_in,
+    )
+
+    ptg.animator.step(0.5)
+    assert target.test_attr == 25
+
+    ptg.animator.step(0.5)
+    assert target.test_attr == 100
+    assert not ptg.animator.is_active
+
+
+def test_animate_attr_easing_decreasing():
+    _reset()
+
+    def _ease_in(progress: float) -> float:
+        return progress**2
+
+    target = MyTarget()
+    ptg.animator.animate_attr(
+        target=target,
+        attr="test_attr",
+        start=100,
+        end=0,
+        duration=1000,
+        easing=_ease_in,
+    )
+
+    # Ease-in from 100 to 0 should leave the value close to 100 at first
+    ptg.animator.step(0.25)
+    assert abs(target.test_attr - 94) <= 1
+
+    ptg.animator.step(0.25)
+    assert abs(target.test_attr - 75) <= 1
+
+    ptg.animator.step(0.5)
+    assert target.test_attr == 0
+
+
+def test_animate_attr_already_at_end():
+    _reset()
+
+    finished = []
+    target = MyTarget()
+
+    ptg.animator.animate_attr(
+        target=target,
+        attr="test_attr",
+        end=target.test_attr,
+        duration=1000,
+        on_finish=finished.append,
+    )
+
+    assert len(finished) == 1
+    assert not ptg.animator.is_active
+    assert not ptg.is_animated(target, "test_attr")
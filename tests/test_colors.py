@@ -9,6 +9,7 @@ from pytermgui import (
     str_to_color,
     terminal,
 )
+from pytermgui.markup.parsing import parse
 
 terminal.forced_colorsystem = ColorSystem.TRUE
 
@@ -111,3 +112,11 @@ def test_bg_hex():
     assert color.name == "#abcdef"
     assert color.sequence == "\x1b[38;2;171;205;239m"
     assert color.sequence == "\x1b[38;2;171;205;239m"
+
+
+def test_parse_follows_colorsystem():
+    with set_colorsystem(terminal, ColorSystem.STANDARD):
+        assert parse("[red]x") == "\x1b[31mx\x1b[0m"
+
+    with set_colorsystem(terminal, ColorSystem.TRUE):
+        assert parse("[red]x") == "\x1b[38;2;255;0;0mx\x1b[0m"
@@ -3,7 +3,9 @@ from __future__ import annotations
 from testfixtures import compare
 
 import pytermgui
-from pytermgui import Color, DensePixelMatrix, str_to_color, tim
+from pytermgui import Color, DensePixelMatrix, str_to_color, tim, tokenize_markup
+from pytermgui.exporters import ExportContext, _handle_tokens_svg, to_html, token_to_css
+from pytermgui.markup import StyledText
 from pytermgui.term import Recorder, Terminal, terminal
 
 try:
@@ -1047,6 +1049,35 @@ def test_export_svg():
     compare(output, SVG_TARGET)
 
 
+def test_token_to_css_invert():
+    token = next(tokenize_markup("[@#123456]"))
+
+    assert token_to_css(token) == "background-color:#123456"
+    assert token_to_css(token, invert=True) == "color:#123456"
+    assert token_to_css(token) == "background-color:#123456"
+
+
+def test_svg_clears_all_targeted_styles():
+    tokens = list(tokenize_markup("[bold italic underline /]text"))
+    text = StyledText("", "text", tokens, None)
+
+    _, _, styles = _handle_tokens_svg(text, "#ffffff", "#000000")
+
+    assert styles == ["fill:#ffffff"]
+
+
+def test_export_context_reuses_classes():
+    context = ExportContext()
+
+    first = to_html(tim.parse("[bold]Bold[/] [italic]Italic"), context=context)
+    second = to_html(tim.parse("[italic]Italic again"), context=context)
+
+    assert len(context.document_styles) == 3
+    assert "<span class='2'>Italic&#160;again</span>" in second
+    assert ".2 {background-color: var(--ptg-background); font-style: italic}" in second
+    assert ".2 {" in first
+
+
 def regenerate_targets():
     Color.default_background = str_to_color("#000000")
     Color.default_foreground = str_to_color("#ffffff")
@@ -17,7 +17,7 @@ from pytermgui import (
 from pytermgui.colors import Color, str_to_color
 from pytermgui.markup import StyledText, Token
 from pytermgui.markup import tokens as tkns
-from pytermgui.markup.parsing import parse_tokens
+from pytermgui.markup.parsing import parse, parse_tokens
 from pytermgui.markup.style_maps import CLEARERS, STYLES
 
 
@@ -100,6 +100,41 @@ class TestParser:
         )
         assert output == "\x1b[38;5;245m\x1b[3mTest", repr(output)
 
+    def test_tokenize_markup_groups(self):
+        def _values(markup: str) -> list[tuple[str, str]]:
+            return [
+                (type(token).__name__, token.value) for token in tokenize_markup(markup)
+            ]
+
+        assert _values("[bold]Bold[/] plain") == [
+            ("StyleToken", "bold"),
+            ("PlainToken", "Bold"),
+            ("ClearToken", "/"),
+            ("PlainToken", " plain"),
+        ]
+
+        assert _values("[not [bold]closed") == [
+            ("PlainToken", "[not "),
+            ("StyleToken", "bold"),
+            ("PlainToken", "closed"),
+        ]
+
+        assert _values("a\\[bold]b[") == [
+            ("PlainToken", "a"),
+            ("PlainToken", "[bold]"),
+            ("PlainToken", "b["),
+        ]
+
+    def test_tokenize_ansi_extended_colors(self):
+        tokens = list(tokenize_ansi("\x1b[38;5;141;48;2;1;2;3;1mText"))
+
+        assert [token.markup for token in tokens] == [
+            "141",
+            "@1;2;3",
+            "bold",
+            "Text",
+        ]
+
     def test_get_markup(self):
         base = "[141 @61 bold]Hello[/]"
         ansi = tim.parse("[141 @61 bold]Hello")
@@ -126,6 +161,10 @@ class TestParser:
             == "\x1b[38;5;141m\x1b[48;5;61m\x1b[1mHELLO\x1b[0m"
         ), repr(tim.parse("[141 @61 bold !upper]Hello"))
 
+    def test_parse_single_reset(self):
+        assert tim.parse("[bold]Hello[/]") == "\x1b[1mHello\x1b[0m"
+        assert parse("[bold]Hello") == "\x1b[1mHello\x1b[0m"
+
     def test_mutiple_hypertext_closing_sequence(self):
         for plain in tim.group_styles(
             "\x1b]8;;path.py\x1b\\inner\x1b]8;;\x1b\\\x1b]8;;\x1b\\outer"
@@ -38,3 +38,11 @@ def test_has_open_sequence():
     )
 
     assert has_open_sequence("\x1b[38;5;141hello I aM Missing a lowercase M\x1b[1m")
+
+
+def test_strip_ansi_sequences():
+    assert strip_ansi("\x1b[38;5;141mA\x1b[1;2HB\x1b[0m") == "AB"
+    assert strip_ansi("\x1b]8;;https://example.com\x1b\\link\x1b]8;;\x1b\\") == "link"
+
+    # Unterminated SGR sequences don't span across lines
+    assert strip_ansi("\x1b[1\nText\x1b[0m") == "\x1b[1\nText"